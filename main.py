@@ -7,11 +7,132 @@ Captures screenshot via ADB → Extracts text with OCR → Visualizes with recta
 import os
 import sys
 import time
-from src.adb_capture import capture_screenshot
+from src.adb_capture import capture_screenshot, capture_settled_screenshot
 from src.image_processor import process_image
 from src.ocr_extractor import extract_text
 from src.visualizer import draw_ocr_results, save_results, print_results
 from src.text_corrector import correct_ocr_results, get_dictionary_stats
+from src.artifact_writer import ArtifactWriter
+from src.memory_monitor import MemoryMonitor
+
+
+def run_monitor(capture, writer, monitor, crop_left, scale_factor, languages,
+                use_gpu, optimize_params, enhance, text_correction,
+                correction_threshold, visualized_path, results_path,
+                interval=1.0, report_every=10, ring_size=10, max_failures=10):
+    """
+    Long-running capture → OCR loop with bounded memory
+
+    Each frame's intermediate images are dropped as soon as the next stage
+    has consumed them, visualization draws on the processed image in place,
+    and memory is sampled per stage by the monitor. Visualized frames are
+    written to a ring of `ring_size` files, so disk use is bounded too.
+    A frame that raises is logged (and recorded by the monitor) and the
+    loop continues. Runs until interrupted, the monitor's memory budget is
+    exceeded, or `max_failures` frames in a row fail.
+
+    Args:
+        capture (callable): Returns the path of a fresh screenshot
+        writer (ArtifactWriter): Background writer for visualized frames
+        monitor (MemoryMonitor): Per-stage memory sampler
+        crop_left (int): Pixels to crop from the left
+        scale_factor (float): Scaling factor
+        languages (list): OCR language codes
+        use_gpu (bool): Use GPU if available
+        optimize_params (bool): Use optimized OCR parameters
+        enhance (bool): Apply image enhancement
+        text_correction (bool): Apply dictionary text correction
+        correction_threshold (float): Confidence threshold for correction
+        visualized_path (str): Base path for visualized frames (suffixed with the ring slot)
+        results_path (str): Path of the latest text results
+        interval (float): Minimum seconds between frames
+        report_every (int): Write the memory report every N frames
+        ring_size (int): Number of visualized frame files to rotate through
+        max_failures (int): Consecutive failed frames before giving up
+    """
+    print("🔁 Long-running mode (Ctrl+C to stop)")
+    if monitor.budget_mb is not None:
+        print(f"   Memory budget: {monitor.budget_mb:.0f}MB")
+    print()
+
+    visualized_base, visualized_ext = os.path.splitext(visualized_path)
+    saved_frames = 0
+    consecutive_failures = 0
+    image = ocr_results = None
+    monitor.start()
+
+    try:
+        while True:
+            frame_start = time.time()
+            monitor.next_frame()
+            print(f"--- Frame {monitor.frame} ---")
+
+            try:
+                with monitor.stage("capture"):
+                    screenshot_path = capture()
+
+                with monitor.stage("process_image"):
+                    image = process_image(
+                        screenshot_path,
+                        crop_left=crop_left,
+                        scale_factor=scale_factor,
+                        enhance=enhance
+                    )
+
+                with monitor.stage("extract_text"):
+                    ocr_results = extract_text(
+                        image,
+                        languages=languages,
+                        use_gpu=use_gpu,
+                        optimize_params=optimize_params
+                    )
+
+                if text_correction:
+                    with monitor.stage("correct_text"):
+                        ocr_results, _ = correct_ocr_results(
+                            ocr_results,
+                            confidence_threshold=correction_threshold
+                        )
+
+                if writer.should_keep(ocr_results):
+                    with monitor.stage("draw_ocr_results"):
+                        # The processed image is not needed after OCR, so draw on it directly
+                        image = draw_ocr_results(image, ocr_results, inplace=True)
+                    # Overwrite the oldest slot instead of adding a file per frame
+                    frame_path = f"{visualized_base}_{saved_frames % ring_size:02d}{visualized_ext}"
+                    saved_frames += 1
+                    print(f"💾 Visualization queued for {writer.submit(image, frame_path)}")
+
+                save_results(ocr_results, results_path)
+                consecutive_failures = 0
+
+            except MemoryError:
+                raise
+            except Exception as e:
+                # One bad frame (adb drop, OCR error, failed save) must not end the run
+                consecutive_failures += 1
+                print(f"❌ Frame {monitor.frame} failed ({consecutive_failures}/{max_failures}): {e}")
+                if consecutive_failures >= max_failures:
+                    print(f"⛔ {max_failures} consecutive failures, stopping")
+                    raise
+
+            # Release this frame's buffers before the next capture
+            image = ocr_results = None
+
+            if monitor.frame % report_every == 0:
+                monitor.write_report()
+                print(f"📊 Memory report written to {monitor.report_path}")
+
+            elapsed = time.time() - frame_start
+            time.sleep(max(0.0, interval - elapsed))
+            print()
+
+    except KeyboardInterrupt:
+        print("\n⏹️  Stopped by user")
+    finally:
+        monitor.write_report()
+        monitor.stop()
+        print(f"📊 Memory report written to {monitor.report_path}")
 
 
 def main():
@@ -40,12 +161,81 @@ def main():
     TEXT_CORRECTION = True   # 텍스트 오타 보정
     CORRECTION_THRESHOLD = 0.8  # 신뢰도 80% 이하만 보정
 
+    # Screen settle detection (애니메이션 중 캡처 방지)
+    SETTLE_WAIT = False      # 화면이 안정될 때까지 대기 후 캡처
+    SETTLE_TIME = 0.5        # 안정 상태 유지 시간 (초)
+    SETTLE_TIMEOUT = 5.0     # 최대 대기 시간 (초)
+    SETTLE_THRESHOLD = 1.0   # 프레임 간 평균 차이 허용치 (0-255)
+
+    # Artifact saving (background thread pool)
+    ARTIFACT_POLICY = "all"  # all / none / on_change / low_confidence / every_n
+    ARTIFACT_FORMAT = "png"  # png (compress_level=1) / webp / npy
+    ARTIFACT_EVERY_N = 10    # every_n 정책의 저장 간격
+    ARTIFACT_CONFIDENCE_THRESHOLD = 0.6  # low_confidence 정책의 신뢰도 기준
+    MAX_PENDING_SAVES = 4    # 대기 중인 저장 작업 최대 개수 (메모리 제한)
+
+    # Long-running mode (24/7 모니터링)
+    LONG_RUNNING = False     # 반복 실행 모드
+    LOOP_INTERVAL = 1.0      # 프레임 간 최소 간격 (초)
+    MEMORY_BUDGET_MB = 2048  # RSS 상한 (초과 시 중단, None = 제한 없음)
+    MEMORY_REPORT_PATH = "memory_report.txt"
+    MEMORY_REPORT_EVERY = 10  # N 프레임마다 메모리 리포트 기록
+    MEMORY_TRACE = False     # tracemalloc 단계별 할당 추적 (느려짐, 누수 조사 시에만 ON)
+    LONG_RUNNING_ARTIFACT_POLICY = "on_change"  # 반복 실행 시 저장 정책 (ARTIFACT_POLICY 대신 사용)
+    ARTIFACT_RING_SIZE = 10  # 반복 실행 시 순환 저장할 시각화 이미지 개수
+    MAX_CONSECUTIVE_FAILURES = 10  # 연속 실패 허용 프레임 수 (초과 시 중단)
+
+    writer = ArtifactWriter(
+        policy=LONG_RUNNING_ARTIFACT_POLICY if LONG_RUNNING else ARTIFACT_POLICY,
+        image_format=ARTIFACT_FORMAT,
+        every_n=ARTIFACT_EVERY_N,
+        confidence_threshold=ARTIFACT_CONFIDENCE_THRESHOLD,
+        max_pending=MAX_PENDING_SAVES
+    )
+
+    def capture():
+        """Capture a screenshot using the configured capture mode"""
+        if SETTLE_WAIT:
+            return capture_settled_screenshot(
+                SCREENSHOT_PATH,
+                settle_time=SETTLE_TIME,
+                timeout=SETTLE_TIMEOUT,
+                diff_threshold=SETTLE_THRESHOLD
+            )
+        return capture_screenshot(SCREENSHOT_PATH)
+
     try:
+        if LONG_RUNNING:
+            run_monitor(
+                capture,
+                writer,
+                MemoryMonitor(
+                    budget_mb=MEMORY_BUDGET_MB,
+                    report_path=MEMORY_REPORT_PATH,
+                    trace=MEMORY_TRACE
+                ),
+                crop_left=CROP_LEFT,
+                scale_factor=SCALE_FACTOR,
+                languages=LANGUAGES,
+                use_gpu=USE_GPU,
+                optimize_params=OPTIMIZE_PARAMS,
+                enhance=ENHANCE_IMAGE,
+                text_correction=TEXT_CORRECTION,
+                correction_threshold=CORRECTION_THRESHOLD,
+                visualized_path=VISUALIZED_PATH,
+                results_path=RESULTS_PATH,
+                interval=LOOP_INTERVAL,
+                report_every=MEMORY_REPORT_EVERY,
+                ring_size=ARTIFACT_RING_SIZE,
+                max_failures=MAX_CONSECUTIVE_FAILURES
+            )
+            return
+
         # Step 1: Capture screenshot via ADB
         print("STEP 1: Capture Screenshot")
         print("-" * 60)
         step1_start = time.time()
-        screenshot_path = capture_screenshot(SCREENSHOT_PATH)
+        screenshot_path = capture()
         step1_time = (time.time() - step1_start) * 1000
         print(f"⏱️  Time: {step1_time:.2f}ms")
         print()
@@ -60,10 +250,6 @@ def main():
             scale_factor=SCALE_FACTOR,
             enhance=ENHANCE_IMAGE
         )
-
-        # Save processed image for reference
-        processed_image.save(PROCESSED_PATH)
-        print(f"💾 Processed image saved to {PROCESSED_PATH}")
         step2_time = (time.time() - step2_start) * 1000
         print(f"⏱️  Time: {step2_time:.2f}ms")
         print()
@@ -107,9 +293,16 @@ def main():
         print("STEP 4: Visualize OCR Results")
         print("-" * 60)
         step4_start = time.time()
-        visualized_image = draw_ocr_results(processed_image, ocr_results)
-        visualized_image.save(VISUALIZED_PATH)
-        print(f"💾 Visualization saved to {VISUALIZED_PATH}")
+        artifacts_queued = writer.should_keep(ocr_results)
+        if artifacts_queued:
+            # Saves run in the background; only drawing is timed here
+            processed_path = writer.submit(processed_image, PROCESSED_PATH)
+            print(f"💾 Processed image queued for {processed_path}")
+            visualized_image = draw_ocr_results(processed_image, ocr_results)
+            visualized_path = writer.submit(visualized_image, VISUALIZED_PATH)
+            print(f"💾 Visualization queued for {visualized_path}")
+        else:
+            print(f"⏭️  Skipped by artifact policy '{ARTIFACT_POLICY}'")
         step4_time = (time.time() - step4_start) * 1000
         print(f"⏱️  Time: {step4_time:.2f}ms")
         print()
@@ -123,6 +316,11 @@ def main():
         step5_time = (time.time() - step5_start) * 1000
         print(f"⏱️  Time: {step5_time:.2f}ms")
 
+        # Wait for background saves (not part of any step)
+        flush_start = time.time()
+        writer.flush()
+        flush_time = (time.time() - flush_start) * 1000
+
         # Total time
         total_time = (time.time() - total_start) * 1000
 
@@ -136,20 +334,24 @@ def main():
             print(f"Step 3.5 (Text Correct):  {step35_time:>10.2f}ms")
         print(f"Step 4 (Visualization):   {step4_time:>10.2f}ms")
         print(f"Step 5 (Save Results):    {step5_time:>10.2f}ms")
+        print(f"Artifact flush (wait):    {flush_time:>10.2f}ms")
         print("-"*60)
         print(f"Total Time:               {total_time:>10.2f}ms ({total_time/1000:.2f}s)")
         print("="*60)
 
         print("\n✅ Complete! Check these files:")
         print(f"   - Original: {SCREENSHOT_PATH}")
-        print(f"   - Processed: {PROCESSED_PATH}")
-        print(f"   - Visualized: {VISUALIZED_PATH}")
+        if artifacts_queued:
+            print(f"   - Processed: {writer.resolve_path(PROCESSED_PATH)}")
+            print(f"   - Visualized: {writer.resolve_path(VISUALIZED_PATH)}")
         print(f"   - Text results: {RESULTS_PATH}")
         print("="*60)
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
         sys.exit(1)
+    finally:
+        writer.close()
 
 
 if __name__ == "__main__":
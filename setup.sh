@@ -10,7 +10,7 @@ source venv/bin/activate
 
 echo "Installing required packages..."
 pip install --upgrade pip
-pip install easyocr pillow
+pip install easyocr pillow psutil
 
 echo "Setup complete!"
 echo "To run the OCR script, use:"
@@ -3,6 +3,10 @@
 
 import subprocess
 import os
+import time
+
+import numpy as np
+from PIL import Image
 
 
 def capture_screenshot(output_path="screenshot.png"):
@@ -42,3 +46,159 @@ def capture_screenshot(output_path="screenshot.png"):
     except subprocess.CalledProcessError as e:
         print(f"❌ Error capturing screenshot: {e}")
         raise
+
+
+# Android PixelFormat values in the raw screencap header → bytes per pixel
+SCREENCAP_FORMATS = {
+    1: 4,  # RGBA_8888
+    2: 4,  # RGBX_8888
+    3: 3,  # RGB_888
+    4: 2,  # RGB_565
+}
+
+
+def grab_raw_frame():
+    """
+    Grab a full-resolution frame from raw `screencap` output
+
+    Skips PNG encoding on the device, but the whole raw frame is
+    transferred over adb (about 10MB at 1080x2400).
+
+    Returns:
+        numpy.ndarray: (height, width, 3) uint8 RGB array
+
+    Raises:
+        ValueError: Unsupported pixel format or malformed screencap output
+    """
+    raw = subprocess.run(
+        ["adb", "exec-out", "screencap"],
+        check=True,
+        capture_output=True
+    ).stdout
+
+    if len(raw) < 12:
+        raise ValueError(f"Unexpected screencap output ({len(raw)} bytes)")
+
+    # Header: width, height, format (+ colorspace on newer Android)
+    width, height, pixel_format = (int(v) for v in np.frombuffer(raw, dtype="<u4", count=3))
+    if pixel_format not in SCREENCAP_FORMATS:
+        raise ValueError(f"Unsupported screencap pixel format: {pixel_format}")
+
+    bytes_per_pixel = SCREENCAP_FORMATS[pixel_format]
+    header_size = len(raw) - width * height * bytes_per_pixel
+    if header_size not in (12, 16):
+        raise ValueError(f"Unexpected screencap output ({len(raw)} bytes for {width}x{height})")
+
+    if bytes_per_pixel == 2:
+        # RGB_565: unpack 5/6/5-bit channels and scale to 0-255
+        packed = np.frombuffer(raw, dtype="<u2", offset=header_size).reshape(height, width)
+        rgb = np.empty((height, width, 3), dtype=np.uint8)
+        rgb[..., 0] = (packed >> 11) * 255 // 31
+        rgb[..., 1] = ((packed >> 5) & 0x3F) * 255 // 63
+        rgb[..., 2] = (packed & 0x1F) * 255 // 31
+        return rgb
+
+    pixels = np.frombuffer(raw, dtype=np.uint8, offset=header_size).reshape(height, width, bytes_per_pixel)
+    return pixels[:, :, :3]
+
+
+def preview_frame(frame, sample_step=8):
+    """
+    Subsample a full-resolution frame to grayscale for change detection
+
+    Args:
+        frame (numpy.ndarray): (height, width, 3) RGB frame from grab_raw_frame
+        sample_step (int): Pixel stride used for downsampling
+
+    Returns:
+        numpy.ndarray: 2D float32 array of luminance values
+    """
+    return frame[::sample_step, ::sample_step].astype(np.float32).mean(axis=2)
+
+
+def frame_difference(frame_a, frame_b):
+    """
+    Mean absolute difference between two preview frames
+
+    Args:
+        frame_a (numpy.ndarray): Preview frame
+        frame_b (numpy.ndarray): Preview frame
+
+    Returns:
+        float: Mean absolute luminance difference (0-255)
+    """
+    if frame_a.shape != frame_b.shape:
+        return 255.0
+    return float(np.abs(frame_a - frame_b).mean())
+
+
+def capture_settled_screenshot(output_path="screenshot.png", settle_time=0.5,
+                               timeout=5.0, diff_threshold=1.0,
+                               sample_step=8, poll_interval=0.1):
+    """
+    Wait for the screen to stop changing, then save the settled frame
+
+    Raw frames are compared on a subsampled grayscale preview until the
+    inter-frame difference stays below `diff_threshold` for `settle_time`
+    seconds. The last frame of that stable window is saved directly, so
+    the saved image is exactly the frame judged stable. If the screen does
+    not settle before `timeout`, or raw frames cannot be read, a regular
+    capture_screenshot() is taken instead.
+
+    Args:
+        output_path (str): Path to save the screenshot
+        settle_time (float): Seconds the screen must stay stable
+        timeout (float): Maximum seconds to wait for the screen to settle
+        diff_threshold (float): Max mean abs difference treated as "stable"
+        sample_step (int): Pixel stride for preview frames
+        poll_interval (float): Seconds between raw frames
+
+    Returns:
+        str: Path to the saved screenshot
+    """
+    print(f"⏳ Waiting for screen to settle ({settle_time}s stable, timeout {timeout}s)...")
+
+    try:
+        frame = _wait_for_settle(settle_time, timeout, diff_threshold, sample_step, poll_interval)
+    except (ValueError, subprocess.CalledProcessError) as e:
+        print(f"   ⚠️  Settle detection unavailable ({e}), capturing immediately")
+        frame = None
+
+    if frame is None:
+        return capture_screenshot(output_path)
+
+    Image.fromarray(frame).save(output_path, format="PNG", compress_level=1)
+    print(f"✅ Screenshot saved to {output_path}")
+    return output_path
+
+
+def _wait_for_settle(settle_time, timeout, diff_threshold, sample_step, poll_interval):
+    """
+    Poll raw frames until the screen is stable or the timeout expires
+
+    Returns:
+        numpy.ndarray: Last stable full-resolution frame, or None on timeout
+    """
+    start = time.time()
+    frame = grab_raw_frame()
+    previous = preview_frame(frame, sample_step)
+    stable_since = time.time()
+    samples = 1
+
+    while True:
+        now = time.time()
+        if now - stable_since >= settle_time:
+            print(f"   ✓ Screen settled after {now - start:.2f}s ({samples} samples)")
+            return frame
+        if now - start >= timeout:
+            print(f"   ⚠️  Screen did not settle within {timeout}s, capturing anyway")
+            return None
+
+        time.sleep(poll_interval)
+        frame = grab_raw_frame()
+        current = preview_frame(frame, sample_step)
+        samples += 1
+
+        if frame_difference(previous, current) > diff_threshold:
+            stable_since = time.time()
+        previous = current
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Artifact Writer Module - 백그라운드 이미지 저장"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# 저장 정책
+POLICY_ALL = "all"                        # 모든 프레임 저장
+POLICY_NONE = "none"                      # 저장 안 함
+POLICY_ON_CHANGE = "on_change"            # OCR 텍스트가 바뀐 경우만 저장
+POLICY_LOW_CONFIDENCE = "low_confidence"  # 신뢰도 낮은 영역이 있는 경우만 저장
+POLICY_EVERY_N = "every_n"                # N번째 프레임마다 저장
+
+POLICIES = (POLICY_ALL, POLICY_NONE, POLICY_ON_CHANGE, POLICY_LOW_CONFIDENCE, POLICY_EVERY_N)
+
+# 저장 포맷별 확장자
+FORMAT_EXTENSIONS = {
+    "png": ".png",
+    "webp": ".webp",
+    "npy": ".npy",
+}
+
+
+class ArtifactWriter:
+    """
+    Queue image saves to a background thread pool so disk I/O stays off the hot path
+
+    Args:
+        policy (str): One of POLICIES
+        image_format (str): "png", "webp" or "npy"
+        every_n (int): Frame interval for POLICY_EVERY_N
+        confidence_threshold (float): Threshold for POLICY_LOW_CONFIDENCE
+        png_compress_level (int): zlib level for PNG (0-9, low = fast)
+        webp_quality (int): WebP quality (0-100)
+        max_workers (int): Number of background writer threads
+        max_pending (int): Max queued saves before submit() blocks (None = unbounded)
+    """
+
+    def __init__(self, policy=POLICY_ALL, image_format="png", every_n=10,
+                 confidence_threshold=0.6, png_compress_level=1,
+                 webp_quality=80, max_workers=2, max_pending=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown artifact policy: {policy} (choose from {POLICIES})")
+        if image_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"Unknown image format: {image_format} (choose from {tuple(FORMAT_EXTENSIONS)})")
+
+        self.policy = policy
+        self.image_format = image_format
+        self.every_n = max(1, every_n)
+        self.confidence_threshold = confidence_threshold
+        self.png_compress_level = png_compress_level
+        self.webp_quality = webp_quality
+        self.max_pending = max_pending
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact")
+        self._pending = []
+        self._frame_index = 0
+        self._last_texts = None
+
+    def should_keep(self, ocr_results):
+        """
+        Evaluate the save policy for the current frame
+
+        Call once per frame; advances the internal frame counter.
+
+        Args:
+            ocr_results (list): OCR results [(bbox, text, confidence), ...]
+
+        Returns:
+            bool: True if this frame's artifacts should be saved
+        """
+        frame_index = self._frame_index
+        self._frame_index += 1
+
+        if self.policy == POLICY_ALL:
+            return True
+        if self.policy == POLICY_NONE:
+            return False
+        if self.policy == POLICY_EVERY_N:
+            return frame_index % self.every_n == 0
+        if self.policy == POLICY_LOW_CONFIDENCE:
+            return any(confidence < self.confidence_threshold
+                       for _, _, confidence in ocr_results)
+
+        # POLICY_ON_CHANGE
+        texts = tuple(text for _, text, _ in ocr_results)
+        changed = texts != self._last_texts
+        self._last_texts = texts
+        return changed
+
+    def resolve_path(self, path):
+        """
+        Replace the extension of path with the one for the configured format
+
+        Args:
+            path (str): Requested output path
+
+        Returns:
+            str: Path that will actually be written
+        """
+        return os.path.splitext(path)[0] + FORMAT_EXTENSIONS[self.image_format]
+
+    def submit(self, image, path):
+        """
+        Queue an image save on the background pool
+
+        The image must not be modified after it is submitted. When
+        max_pending saves are already queued, blocks until the oldest finishes
+        so queued images cannot grow memory without bound.
+
+        Args:
+            image (PIL.Image): Image to save
+            path (str): Output path (extension is replaced to match the format)
+
+        Returns:
+            str: Path that will be written
+
+        Raises:
+            Exception: The error of an earlier background save that has finished
+        """
+        output_path = self.resolve_path(path)
+        # Collect finished saves, re-raising any background error
+        while self._pending and self._pending[0].done():
+            self._pending.pop(0).result()
+        if self.max_pending is not None:
+            while len(self._pending) >= self.max_pending:
+                self._pending.pop(0).result()
+        self._pending.append(self._executor.submit(self._write, image, output_path))
+        return output_path
+
+    def _write(self, image, output_path):
+        """Encode and write a single image (runs on a worker thread)"""
+        if self.image_format == "npy":
+            np.save(output_path, np.asarray(image))
+        elif self.image_format == "webp":
+            image.save(output_path, format="WEBP", quality=self.webp_quality)
+        else:
+            image.save(output_path, format="PNG", compress_level=self.png_compress_level)
+        return output_path
+
+    def flush(self):
+        """
+        Block until all queued saves have finished
+
+        Raises:
+            Exception: The first error raised by a background save
+        """
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        """Flush pending saves and shut down the thread pool"""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -19,20 +19,21 @@ def process_image(input_path, crop_left=850, scale_factor=0.5, enhance=True):
     """
     print(f"🖼️  Processing image: crop_left={crop_left}px, scale={scale_factor}x")
 
-    # Open image
-    img = Image.open(input_path)
-    print(f"   Original size: {img.size}")
-
-    # Crop: remove left pixels
-    width, height = img.size
-    img_cropped = img.crop((crop_left, 0, width, height))
-    print(f"   After crop: {img_cropped.size}")
-
-    # Scale
-    new_width = int(img_cropped.width * scale_factor)
-    new_height = int(img_cropped.height * scale_factor)
-    img_scaled = img_cropped.resize((new_width, new_height), Image.LANCZOS)
-    print(f"   After scaling: {img_scaled.size}")
+    # Open image (closed as soon as the scaled copy exists)
+    with Image.open(input_path) as img:
+        print(f"   Original size: {img.size}")
+
+        # Crop: remove left pixels
+        width, height = img.size
+        crop_box = (crop_left, 0, width, height)
+        crop_width, crop_height = width - crop_left, height
+        print(f"   After crop: {(crop_width, crop_height)}")
+
+        # Scale: crop and resize in one pass (no intermediate cropped copy)
+        new_width = int(crop_width * scale_factor)
+        new_height = int(crop_height * scale_factor)
+        img_scaled = img.resize((new_width, new_height), Image.LANCZOS, box=crop_box)
+        print(f"   After scaling: {img_scaled.size}")
 
     # Enhance image for better OCR
     if enhance:
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Memory Monitor Module - 단계별 메모리 측정 및 메모리 예산 관리"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Windows
+
+
+def get_rss_mb():
+    """
+    Current resident set size of this process
+
+    Uses psutil when installed, otherwise /proc/self/statm (Linux),
+    falling back to peak RSS from the resource module.
+
+    Returns:
+        float: RSS in MB
+
+    Raises:
+        RuntimeError: No RSS source on this platform (see rss_available)
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if resource is None:
+        raise RuntimeError("RSS measurement needs psutil on this platform (pip install psutil)")
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def rss_available():
+    """
+    Whether get_rss_mb() has any source on this platform
+
+    False only without psutil on systems that have neither /proc nor
+    the resource module (Windows).
+
+    Returns:
+        bool: True if RSS can be measured
+    """
+    return psutil is not None or os.path.exists("/proc/self/statm") or resource is not None
+
+
+def rss_is_peak():
+    """
+    Whether get_rss_mb() can only report peak RSS
+
+    True without psutil on systems lacking /proc (e.g. macOS), where the
+    reading comes from ru_maxrss and never goes down.
+
+    Returns:
+        bool: True if RSS readings are peak-only
+    """
+    return psutil is None and not os.path.exists("/proc/self/statm")
+
+
+class MemoryMonitor:
+    """
+    Sample tracemalloc and RSS per pipeline stage and enforce a memory budget
+
+    When only peak RSS is available (see rss_is_peak), the report labels
+    readings as peak values and the budget is not enforced, since garbage
+    collection can never bring a peak reading back down.
+
+    Args:
+        budget_mb (float): Hard RSS limit in MB (None = no limit)
+        report_path (str): Path of the text report written by write_report()
+        trace (bool): Enable tracemalloc (adds some CPU overhead)
+        history (int): Max number of stage records kept in memory
+
+    Raises:
+        RuntimeError: RSS cannot be measured on this platform (install psutil)
+    """
+
+    def __init__(self, budget_mb=None, report_path="memory_report.txt", trace=True, history=2000):
+        if not rss_available():
+            raise RuntimeError(
+                "Memory monitoring needs psutil on this platform: pip install psutil"
+            )
+
+        self.budget_mb = budget_mb
+        self.report_path = report_path
+        self.trace = trace
+        # Bounded so the monitor itself does not grow in 24/7 runs
+        self.records = deque(maxlen=history)
+        self.frame = 0
+        self.peak_only = rss_is_peak()
+        self._baseline_rss = None
+        self._budget_warned = False
+
+    def start(self):
+        """Start tracing and record the baseline RSS"""
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._baseline_rss = get_rss_mb()
+
+    def stop(self):
+        """Stop tracing"""
+        if self.trace and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def next_frame(self):
+        """Advance the frame counter used to label records"""
+        self.frame += 1
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Measure memory use of the enclosed block
+
+        A record is written even when the block raises, tagged with the
+        exception type; the budget is only checked after a successful stage.
+
+        Args:
+            name (str): Stage name (e.g. "process_image")
+        """
+        tracing = self.trace and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_before = tracemalloc.get_traced_memory()[0]
+        rss_before = get_rss_mb()
+        start = time.time()
+        error = None
+
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            elapsed_ms = (time.time() - start) * 1000
+            rss_after = get_rss_mb()
+            record = {
+                "frame": self.frame,
+                "stage": name,
+                "time_ms": elapsed_ms,
+                "rss_mb": rss_after,
+                "rss_delta_mb": rss_after - rss_before,
+                "traced_mb": 0.0,
+                "traced_peak_mb": 0.0,
+                "traced_delta_mb": 0.0,
+                "error": error,
+            }
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                record["traced_mb"] = current / (1024 * 1024)
+                record["traced_peak_mb"] = peak / (1024 * 1024)
+                record["traced_delta_mb"] = (current - traced_before) / (1024 * 1024)
+            self.records.append(record)
+
+        self.check_budget()
+
+    def check_budget(self):
+        """
+        Enforce the memory budget
+
+        Runs a full garbage collection when RSS exceeds the budget and
+        raises if it is still over afterwards.
+
+        Raises:
+            MemoryError: RSS stays above budget_mb after collection
+        """
+        if self.budget_mb is None:
+            return
+
+        if self.peak_only:
+            if not self._budget_warned:
+                print("⚠️  Only peak RSS is available (install psutil), memory budget not enforced")
+                self._budget_warned = True
+            return
+
+        rss = get_rss_mb()
+        if rss <= self.budget_mb:
+            return
+
+        gc.collect()
+        rss = get_rss_mb()
+        if rss > self.budget_mb:
+            self.write_report()
+            raise MemoryError(
+                f"Memory budget exceeded: {rss:.1f}MB > {self.budget_mb:.1f}MB "
+                f"(report: {self.report_path})"
+            )
+
+    def summary(self):
+        """
+        Aggregate the retained records per stage
+
+        Returns:
+            dict: {stage: {"count", "max_rss_mb", "max_traced_peak_mb", "avg_traced_delta_mb"}}
+        """
+        stages = {}
+        for record in self.records:
+            stats = stages.setdefault(record["stage"], {
+                "count": 0,
+                "max_rss_mb": 0.0,
+                "max_traced_peak_mb": 0.0,
+                "total_traced_delta_mb": 0.0,
+            })
+            stats["count"] += 1
+            stats["max_rss_mb"] = max(stats["max_rss_mb"], record["rss_mb"])
+            stats["max_traced_peak_mb"] = max(stats["max_traced_peak_mb"], record["traced_peak_mb"])
+            stats["total_traced_delta_mb"] += record["traced_delta_mb"]
+
+        for stats in stages.values():
+            stats["avg_traced_delta_mb"] = stats.pop("total_traced_delta_mb") / stats["count"]
+        return stages
+
+    def write_report(self, max_records=200):
+        """
+        Write per-stage summary and the most recent records to report_path
+
+        Args:
+            max_records (int): Number of most recent records to include
+        """
+        rss_now = get_rss_mb()
+        rss_label = "Peak RSS" if self.peak_only else "RSS"
+
+        with open(self.report_path, 'w', encoding='utf-8') as f:
+            f.write("="*60 + "\n")
+            f.write("MEMORY REPORT\n")
+            f.write("="*60 + "\n\n")
+
+            f.write(f"{'Frames:':<20}{self.frame}\n")
+            f.write(f"{'tracemalloc:':<20}{'on' if self.trace else 'off (trace columns are 0)'}\n")
+            if self._baseline_rss is not None:
+                f.write(f"{'Baseline ' + rss_label + ':':<20}{self._baseline_rss:.1f}MB\n")
+                f.write(f"{rss_label + ' growth:':<20}{rss_now - self._baseline_rss:+.1f}MB\n")
+            f.write(f"{'Current ' + rss_label + ':':<20}{rss_now:.1f}MB\n")
+            if self.budget_mb is not None:
+                enforced = " (not enforced: peak RSS only, install psutil)" if self.peak_only else ""
+                f.write(f"{'Budget:':<20}{self.budget_mb:.1f}MB{enforced}\n")
+            f.write("\n")
+
+            f.write("Per-stage summary\n")
+            f.write("-"*60 + "\n")
+            f.write(f"{'Stage':<20}{'Count':>8}{'Max ' + rss_label:>14}{'Peak trace':>12}{'Avg delta':>12}\n")
+            for name, stats in self.summary().items():
+                f.write(f"{name:<20}{stats['count']:>8}"
+                        f"{stats['max_rss_mb']:>12.1f}MB"
+                        f"{stats['max_traced_peak_mb']:>10.1f}MB"
+                        f"{stats['avg_traced_delta_mb']:>+10.2f}MB\n")
+            f.write("\n")
+
+            f.write(f"Recent records (last {max_records})\n")
+            f.write("-"*60 + "\n")
+            for record in list(self.records)[-max_records:]:
+                f.write(f"frame={record['frame']} stage={record['stage']} "
+                        f"time={record['time_ms']:.1f}ms "
+                        f"{'peak_rss' if self.peak_only else 'rss'}={record['rss_mb']:.1f}MB ({record['rss_delta_mb']:+.1f}) "
+                        f"traced={record['traced_mb']:.1f}MB "
+                        f"peak={record['traced_peak_mb']:.1f}MB"
+                        + (f" error={record['error']}" if record["error"] else "")
+                        + "\n")
@@ -5,7 +5,7 @@ from PIL import Image, ImageDraw, ImageFont
 import os
 
 
-def draw_ocr_results(image, ocr_results, font_path=None, font_size=20):
+def draw_ocr_results(image, ocr_results, font_path=None, font_size=20, inplace=False):
     """
     Draw rectangles and text on image based on OCR results
 
@@ -14,6 +14,7 @@ def draw_ocr_results(image, ocr_results, font_path=None, font_size=20):
         ocr_results (list): OCR results with bbox, text, and confidence
         font_path (str): Path to font file for Korean/English text
         font_size (int): Font size for text display
+        inplace (bool): Draw directly on image instead of a copy (saves a full-size buffer)
 
     Returns:
         PIL.Image: Image with drawn rectangles and text
@@ -21,7 +22,7 @@ def draw_ocr_results(image, ocr_results, font_path=None, font_size=20):
     print(f"🎨 Drawing OCR results on image...")
 
     # Create a copy to draw on
-    img_draw = image.copy()
+    img_draw = image if inplace else image.copy()
     draw = ImageDraw.Draw(img_draw)
 
     # Load font